@@ -1,32 +1,96 @@
+import os
+import signal
 import time
 import math
 from multiprocessing import Process, cpu_count
 
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
 # --- 설정 ---
 PERIOD = 60             # 주기 (초)
 CYCLE_DURATION = 0.1    # 제어 주기 (초)
 
-def cpu_worker(period, cycle_duration):
-    start_time = time.time()
+# 사인파 듀티 테이블을 한 주기 분량 미리 계산 (0.1초 해상도 600개 항목)
+# 매 사이클마다 math.sin 을 다시 부르지 않고 인덱스로 조회만 한다.
+_DUTY_STEPS = int(PERIOD / CYCLE_DURATION)
+_DUTY = [
+    (math.sin(2 * math.pi * i / _DUTY_STEPS) + 1) / 2
+    for i in range(_DUTY_STEPS)
+]
+
+
+def _burn_py(n: int) -> float:
+    s = 0.0
+    for i in range(n):
+        s += i * 1.0000001
+    return s
+
+
+if njit is not None:
+    _burn = njit(cache=True)(_burn_py)
+else:
+    _burn = _burn_py
+
+
+def _calibrate() -> int:
+    """_burn(n) 이 약 1초 걸리는 n 을 1회 측정으로 구한다."""
+    # numba 경로는 첫 호출에 JIT 컴파일/캐시 로드가 섞이므로 측정 전에 예열
+    _burn(1)
+    trial = 1_000_000
+    while True:
+        t0 = time.perf_counter_ns()
+        _burn(trial)
+        dt_ns = time.perf_counter_ns() - t0
+        if dt_ns >= 50_000_000:
+            return max(1, int(trial * 1e9 / dt_ns))
+        trial *= 4
+
+
+def cpu_worker(period, cycle_duration, core=None):
+    # 워커를 코어 하나에 고정 - 스케줄러가 옮기지 않아 코어별 부하가 일정해진다
+    if core is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {core})
+        except OSError:
+            pass
+    n_per_sec = _calibrate()
+    cycle_ns = int(cycle_duration * 1e9)
+
+    # 주기는 커널 인터벌 타이머가 잡는다 - sleep 오차가 사이클마다 누적되지 않음
+    # SIGALRM 을 블록해 두고 sigwait 로 받으면 핸들러/플래그 없이 경쟁이 없다
+    # (연산이 틱을 넘겨도 pending 신호 덕에 sigwait 가 즉시 반환)
+    use_itimer = hasattr(signal, "setitimer") and hasattr(signal, "sigwait")
+    if use_itimer:
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+        signal.setitimer(signal.ITIMER_REAL, cycle_duration, cycle_duration)
+
+    # 벽시계(time.time) 대신 단조 증가 카운터로 위상 계산 - NTP 점프에 안전
+    start_ns = time.perf_counter_ns()
     try:
         while True:
-            elapsed = time.time() - start_time
-            # 사인파 계산 (0.0 ~ 1.0)
-            load_factor = (math.sin(2 * math.pi * elapsed / period) + 1) / 2
-            
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            # 사인파 계산 대신 미리 만든 테이블 조회 (0.0 ~ 1.0)
+            load_factor = _DUTY[(elapsed_ns // cycle_ns) % _DUTY_STEPS]
+
             work_time = cycle_duration * load_factor
-            sleep_time = cycle_duration - work_time
-            
-            # Busy Wait
-            end_time = time.time() + work_time
-            while time.time() < end_time:
-                pass
-                
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+
+            # time.time() 폴링 대신 보정된 횟수만큼 연산으로 태운다
+            if work_time > 0:
+                _burn(int(n_per_sec * work_time))
+
+            if use_itimer:
+                signal.sigwait({signal.SIGALRM})
+            else:
+                sleep_time = cycle_duration - work_time
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
     except KeyboardInterrupt:
         pass
 
+
 def main():
     num_cores = cpu_count()
     print(f"=== CPU Stress Test Only ===")
@@ -35,8 +99,8 @@ def main():
     print("Press Ctrl+C to stop.\n")
 
     processes = []
-    for _ in range(num_cores):
-        p = Process(target=cpu_worker, args=(PERIOD, CYCLE_DURATION))
+    for core in range(num_cores):
+        p = Process(target=cpu_worker, args=(PERIOD, CYCLE_DURATION, core))
         p.daemon = True
         p.start()
         processes.append(p)
@@ -46,20 +110,21 @@ def main():
     try:
         while True:
             elapsed = time.time() - start_time
-            load_factor = (math.sin(2 * math.pi * elapsed / PERIOD) + 1) / 2
-            
+            load_factor = _DUTY[int(elapsed / CYCLE_DURATION) % _DUTY_STEPS]
+
             # 터미널에 현재 부하율 표시 (게이지 바 형태)
             bar_len = 20
             filled_len = int(bar_len * load_factor)
             bar = '█' * filled_len + '-' * (bar_len - filled_len)
             print(f"\rCPU Load: [{bar}] {load_factor*100:.1f}%", end="")
-            
+
             time.sleep(0.5)
-            
+
     except KeyboardInterrupt:
         print("\nStopping CPU test...")
         for p in processes:
             p.terminate()
 
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
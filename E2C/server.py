@@ -1,9 +1,14 @@
 import argparse
 from collections import deque
+import itertools
 import json
 import os
 import platform
+import re
+import select
+import shlex
 import shutil
+import socket
 import subprocess
 import threading
 import time
@@ -18,15 +23,44 @@ try:
 except Exception:
     psutil = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def _json_dumps(obj: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 DEFAULT_REMOTE_IP = "3.36.74.135"
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 5000
 DEFAULT_PATH = "/monitor"
 DEFAULT_POLL_SECONDS = 2
 
-_log_cv = threading.Condition()
-_log_seq = 0
+# 시퀀스 발급과 append 는 한 쌍으로 묶여야 버퍼가 seq 순서를 유지한다
+# - _log_lock 은 그 두 호출 동안만 잡는 짧은 락
+_log_lock = threading.Lock()
+_log_seq_counter = itertools.count(1)
 _log_buf = deque(maxlen=800)
+_log_listeners: Tuple[threading.Event, ...] = ()
+_log_listener_lock = threading.Lock()
+
+
+def _add_log_listener() -> threading.Event:
+    global _log_listeners
+    ev = threading.Event()
+    with _log_listener_lock:
+        _log_listeners = _log_listeners + (ev,)
+    return ev
 
 _last_metrics_log_ts: float = 0.0
 _prev_io_read: Optional[int] = None
@@ -34,18 +68,62 @@ _prev_io_write: Optional[int] = None
 _prev_io_ts: Optional[float] = None
 
 
+def _open_proc(path: str) -> Optional[int]:
+    try:
+        return os.open(path, os.O_RDONLY)
+    except Exception:
+        return None
+
+
+# procfs 파일은 샘플마다 open/close 하지 않고 fd를 들고 pread 로 읽는다
+_STAT_FD = _open_proc("/proc/stat")
+_MEMINFO_FD = _open_proc("/proc/meminfo")
+_DISKSTATS_FD = _open_proc("/proc/diskstats")
+
+
+# fd별로 한 번에 다 읽힌 버퍼 크기를 기억해 다음부터는 pread 한 번으로 끝낸다
+_proc_read_sizes: Dict[int, int] = {}
+
+
+def _pread_proc(fd: Optional[int], size: int = 8192) -> Optional[bytes]:
+    if fd is None:
+        return None
+    size = _proc_read_sizes.get(fd, size)
+    try:
+        # 내용이 버퍼를 꽉 채우면 잘렸을 수 있으니 버퍼를 두 배로 키워 재시도
+        while True:
+            buf = os.pread(fd, size, 0)
+            if len(buf) < size:
+                _proc_read_sizes[fd] = size
+                return buf
+            size *= 2
+    except Exception:
+        return None
+
+
+# SSE 프레임 골격과 초 단위 타임스탬프는 로그마다 다시 만들지 않는다
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_stamp_cache: Tuple[int, str] = (0, "")
+
+
 def _log(line: str) -> None:
-    global _log_seq
-    stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    global _stamp_cache
+    now = int(time.time())
+    cached_sec, stamp = _stamp_cache
+    if now != cached_sec:
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        _stamp_cache = (now, stamp)
     full = f"{stamp} {line}"
     try:
         print(full, flush=True)
     except Exception:
         pass
-    with _log_cv:
-        _log_seq += 1
-        _log_buf.append((_log_seq, full))
-        _log_cv.notify_all()
+    payload = _SSE_PREFIX + full.encode("utf-8") + _SSE_SUFFIX
+    with _log_lock:
+        _log_buf.append((next(_log_seq_counter), full, payload))
+    for ev in _log_listeners:
+        ev.set()
 
 
 def _maybe_log_metrics(metrics: dict) -> None:
@@ -85,9 +163,11 @@ def clamp(n: float, lo: float, hi: float) -> float:
 
 def _read_proc_stat_cpu() -> Optional[Tuple[int, int]]:
     try:
-        with open("/proc/stat", "r", encoding="utf-8") as f:
-            line = f.readline().strip()
-        if not line.startswith("cpu "):
+        buf = _pread_proc(_STAT_FD, 4096)
+        if buf is None:
+            return None
+        line = buf.split(b"\n", 1)[0]
+        if not line.startswith(b"cpu "):
             return None
         parts = line.split()
         values = [int(x) for x in parts[1:]]
@@ -98,36 +178,57 @@ def _read_proc_stat_cpu() -> Optional[Tuple[int, int]]:
         return None
 
 
-def cpu_percent_sample(sample_sec: float = 0.1) -> Optional[float]:
-    a = _read_proc_stat_cpu()
-    if a is None:
+class _SampleState:
+    """틱 사이에 유지되는 이전 카운터 묶음 - 고정 슬롯이라 형태가 변하지 않는다"""
+
+    __slots__ = ("cpu_stat", "psutil_io", "diskstats", "diskstats_ts")
+
+    def __init__(self) -> None:
+        self.cpu_stat: Optional[Tuple[int, int]] = None
+        self.psutil_io: Optional[Tuple[int, int, float]] = None
+        self.diskstats: Optional[Dict[str, Tuple[int, int]]] = None
+        self.diskstats_ts: Optional[float] = None
+
+
+_sample_state = _SampleState()
+
+
+def cpu_percent_delta() -> Optional[float]:
+    """직전 호출과의 /proc/stat 차이로 CPU 사용률 계산 - 샘플 사이 sleep 없음"""
+    cur = _read_proc_stat_cpu()
+    if cur is None:
         return None
-    time.sleep(sample_sec)
-    b = _read_proc_stat_cpu()
-    if b is None:
+    prev = _sample_state.cpu_stat
+    _sample_state.cpu_stat = cur
+    if prev is None:
         return None
-    total_a, idle_a = a
-    total_b, idle_b = b
-    dt = total_b - total_a
-    didle = idle_b - idle_a
+    dt = cur[0] - prev[0]
+    didle = cur[1] - prev[1]
     if dt <= 0:
         return None
     usage = (dt - didle) / dt * 100.0
     return clamp(usage, 0.0, 100.0)
 
 
+def _meminfo_field(buf: bytes, name: bytes) -> Optional[int]:
+    i = buf.find(name)
+    if i < 0:
+        return None
+    return int(buf[i + len(name):buf.find(b"\n", i)].split()[0])
+
+
 def memory_percent_linux() -> Tuple[Optional[float], Optional[float]]:
     try:
-        mem_total = None
-        mem_avail = None
-        with open("/proc/meminfo", "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("MemTotal:"):
-                    mem_total = int(line.split()[1]) * 1024
-                elif line.startswith("MemAvailable:"):
-                    mem_avail = int(line.split()[1]) * 1024
-                if mem_total is not None and mem_avail is not None:
-                    break
+        buf = _pread_proc(_MEMINFO_FD, 2048)
+        if buf is None:
+            return None, None
+        # 두 필드 모두 앞머리에 있으니 줄 순회 없이 find 로 바로 찾는다
+        mem_total = _meminfo_field(buf, b"MemTotal:")
+        mem_avail = _meminfo_field(buf, b"MemAvailable:")
+        if mem_total is not None:
+            mem_total *= 1024
+        if mem_avail is not None:
+            mem_avail *= 1024
         if mem_total is None or mem_avail is None or mem_total <= 0:
             return None, None
         used = mem_total - mem_avail
@@ -138,100 +239,87 @@ def memory_percent_linux() -> Tuple[Optional[float], Optional[float]]:
         return None, None
 
 
-_prev_diskstats: Optional[Dict[str, Tuple[int, int]]] = None
-_prev_diskstats_ts: Optional[float] = None
+# 실제 디스크 이름만 통과 (nvme0n1p1, sda1 같은 파티션과 loop/ram 등은 불일치)
+_DISK_DEV_RE = re.compile(rb"(nvme\d+n\d+|sd[a-z]+|vd[a-z]+|xvd[a-z]+|hd[a-z]+)$")
+
+_diskstats_cache: Optional[Tuple[bytes, Dict[str, Tuple[int, int]]]] = None
 
 
 def _read_diskstats() -> Optional[Dict[str, Tuple[int, int]]]:
     """Linux /proc/diskstats 파싱 - 파티션 제외하고 실제 디스크만 집계"""
+    global _diskstats_cache
     try:
         result: Dict[str, Tuple[int, int]] = {}
-        with open("/proc/diskstats", "r", encoding="utf-8") as f:
-            for line in f:
-                parts = line.split()
-                if len(parts) < 14:
-                    continue
-                dev = parts[2]
-
-                # 1. 램디스크, 루프백 제외
-                if dev.startswith(("loop", "ram")):
-                    continue
-                
-                # 2. 파티션 걸러내기 (sda1, xvda1 등은 제외하고 sda, xvda만 포함)
-                #    nvme0n1(디스크) vs nvme0n1p1(파티션)
-                is_partition = False
-                
-                if dev.startswith("nvme"):
-                    if "p" in dev: 
-                        is_partition = True
-                elif dev.startswith(("sd", "vd", "xvd")):
-                    # 끝자리가 숫자면 파티션일 확률 높음 (sda1, xvda1)
-                    # 하지만 sda 처럼 숫자가 없으면 디스크
-                    if dev[-1].isdigit():
-                        is_partition = True
-                else:
-                    # 그 외 알 수 없는 디바이스는 일단 패스
-                    continue
-
-                if is_partition:
-                    continue
-
-                read_sectors = int(parts[5])
-                write_sectors = int(parts[9])
-                result[dev] = (read_sectors, write_sectors)
+        # loop/NVMe 장치가 많은 호스트에서도 한 번에 읽히도록 넉넉하게 잡는다
+        buf = _pread_proc(_DISKSTATS_FD, 65536)
+        if buf is None:
+            return None
+        # 디스크 활동이 전혀 없었으면 내용이 그대로이므로 파싱을 건너뛴다
+        cache = _diskstats_cache
+        if cache is not None and cache[0] == buf:
+            return cache[1]
+        for line in buf.splitlines():
+            parts = line.split(None, 10)
+            if len(parts) < 11:
+                continue
+            # 분기 체인 대신 정규식 한 번으로 디스크/파티션 분류
+            if _DISK_DEV_RE.fullmatch(parts[2]) is None:
+                continue
+
+            read_sectors = int(parts[5])
+            write_sectors = int(parts[9])
+            result[parts[2].decode("ascii")] = (read_sectors, write_sectors)
+        _diskstats_cache = (buf, result)
         return result
     except Exception:
         return None
 
 
-def io_percent_linux() -> Optional[float]:
-    global _prev_diskstats, _prev_diskstats_ts
+def disk_io_linux() -> Tuple[Optional[float], Optional[int], Optional[int]]:
+    """diskstats 한 번 읽기로 io_percent 와 누적 read/write 바이트를 함께 계산"""
     cur = _read_diskstats()
     now = time.time()
     if cur is None:
-        return None
-
-    if _prev_diskstats is None or _prev_diskstats_ts is None:
-        _prev_diskstats = cur
-        _prev_diskstats_ts = now
-        return 0.0
-
-    dt = now - _prev_diskstats_ts
-    if dt <= 0:
-        return None
+        return None, None, None
 
+    prev = _sample_state.diskstats
+    prev_ts = _sample_state.diskstats_ts
+    read_sectors_total = 0
+    write_sectors_total = 0
     delta_sectors = 0
     for dev, (r, w) in cur.items():
-        prev = _prev_diskstats.get(dev)
-        if prev is None:
-            continue
-        pr, pw = prev
-        dr = max(0, r - pr)
-        dw = max(0, w - pw)
-        delta_sectors += dr + dw
+        read_sectors_total += r
+        write_sectors_total += w
+        if prev is not None:
+            p = prev.get(dev)
+            if p is not None:
+                delta_sectors += max(0, r - p[0]) + max(0, w - p[1])
+
+    _sample_state.diskstats = cur
+    _sample_state.diskstats_ts = now
 
-    _prev_diskstats = cur
-    _prev_diskstats_ts = now
+    read_bytes = read_sectors_total * 512
+    write_bytes = write_sectors_total * 512
+
+    if prev is None or prev_ts is None:
+        return 0.0, read_bytes, write_bytes
+    dt = now - prev_ts
+    if dt <= 0:
+        return None, read_bytes, write_bytes
 
     bytes_per_sec = (delta_sectors * 512) / dt
     # 100MB/s를 100% 기준으로 표시
     percent = (bytes_per_sec / (100 * 1024 * 1024)) * 100.0
-    return clamp(percent, 0.0, 100.0)
+    return clamp(percent, 0.0, 100.0), read_bytes, write_bytes
 
 
-def disk_io_bytes_linux() -> Tuple[Optional[int], Optional[int]]:
-    cur = _read_diskstats()
-    if cur is None:
-        return None, None
-    read_sectors_total = 0
-    write_sectors_total = 0
-    for _, (r, w) in cur.items():
-        read_sectors_total += r
-        write_sectors_total += w
-    return read_sectors_total * 512, write_sectors_total * 512
+# 틱마다 다시 묻지 않는 정적 값들
+_HOST = platform.node()
+_OS = platform.system()
+_SYSTEM = _OS.lower()
 
 
-def get_local_metrics() -> dict:
+def _compute_metrics() -> dict:
     cpu = None
     mem_percent = None
     mem_free_gb = None
@@ -240,10 +328,11 @@ def get_local_metrics() -> dict:
     io_read_bytes = None
     io_write_bytes = None
 
-    system = platform.system().lower()
+    system = _SYSTEM
     if psutil is not None:
         try:
-            cpu = float(psutil.cpu_percent(interval=0.1))
+            # interval=None: 직전 호출 이후의 누적치 기반, 블로킹 없음
+            cpu = float(psutil.cpu_percent(interval=None))
         except Exception:
             cpu = None
         try:
@@ -254,25 +343,23 @@ def get_local_metrics() -> dict:
             mem_percent = None
             mem_free_gb = None
         try:
-            a = psutil.disk_io_counters()
-            ta = time.time()
-            time.sleep(0.2)
-            b = psutil.disk_io_counters()
-            tb = time.time()
-            dt = tb - ta
-            if dt > 0:
-                bytes_per_sec = ((b.read_bytes - a.read_bytes) + (b.write_bytes - a.write_bytes)) / dt
-                io_percent = clamp((bytes_per_sec / (100 * 1024 * 1024)) * 100.0, 0.0, 100.0)
             c = psutil.disk_io_counters()
+            now = time.time()
             io_read_bytes = int(getattr(c, "read_bytes", 0))
             io_write_bytes = int(getattr(c, "write_bytes", 0))
+            if _sample_state.psutil_io is not None:
+                pr, pw, pts = _sample_state.psutil_io
+                dt = now - pts
+                if dt > 0:
+                    bytes_per_sec = ((io_read_bytes - pr) + (io_write_bytes - pw)) / dt
+                    io_percent = clamp((bytes_per_sec / (100 * 1024 * 1024)) * 100.0, 0.0, 100.0)
+            _sample_state.psutil_io = (io_read_bytes, io_write_bytes, now)
         except Exception:
             io_percent = None
     elif system == "linux":
-        cpu = cpu_percent_sample()
+        cpu = cpu_percent_delta()
         mem_percent, mem_free_gb = memory_percent_linux()
-        io_percent = io_percent_linux()
-        io_read_bytes, io_write_bytes = disk_io_bytes_linux()
+        io_percent, io_read_bytes, io_write_bytes = disk_io_linux()
 
     try:
         path = "/" if system == "linux" else os.getcwd()
@@ -293,17 +380,167 @@ def get_local_metrics() -> dict:
         "io_read_bytes": int(io_read_bytes) if io_read_bytes is not None else 0,
         "io_write_bytes": int(io_write_bytes) if io_write_bytes is not None else 0,
         "updated_at": int(time.time() * 1000),
-        "host": platform.node(),
-        "os": platform.system(),
+        "host": _HOST,
+        "os": _OS,
     }
 
 
+class _SSEClient:
+    __slots__ = ("sock", "last_seq", "backlog")
+
+    def __init__(self, sock: socket.socket, last_seq: int) -> None:
+        self.sock = sock
+        self.last_seq = last_seq
+        self.backlog: Optional[memoryview] = None  # 아직 못 보낸 바이트
+
+
+# 이만큼 밀린 클라이언트는 못 따라오는 것으로 보고 끊는다
+_SSE_MAX_BACKLOG = 1 << 20
+
+
+class _SSEBroadcaster(threading.Thread):
+    """하나의 송신 스레드가 모든 /logs 클라이언트 소켓을 맡아 브로드캐스트한다"""
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self._lock = threading.Lock()
+        self._clients = []
+        self._ev = _add_log_listener()
+
+    def add_client(self, sock: socket.socket, last_seq: int) -> None:
+        sock.setblocking(False)
+        with self._lock:
+            self._clients.append(_SSEClient(sock, last_seq))
+
+    def _drop(self, client: _SSEClient) -> None:
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+        try:
+            client.sock.close()
+        except Exception:
+            pass
+
+    def run(self) -> None:
+        while True:
+            self._ev.wait(timeout=1.0)
+            self._ev.clear()
+            with self._lock:
+                clients = list(self._clients)
+            if not clients:
+                continue
+
+            # 새 로그를 클라이언트별 미전송 버퍼에 붙인다
+            # (프레임 바이트는 _log 에서 한 번만 인코딩된 것을 전원이 공유)
+            # 시퀀스는 연속이므로 가장 뒤처진 클라이언트 기준 꼬리만 잘라 온다
+            # - len/인덱스 계산과 islice 사이에 append 가 끼면 꼬리가 밀리므로
+            #   스냅샷은 _log_lock 아래에서 한 번에 뜬다
+            min_seq = min(c.last_seq for c in clients)
+            with _log_lock:
+                n = len(_log_buf)
+                latest_seq = _log_buf[-1][0] if n else 0
+                if latest_seq > min_seq:
+                    count = min(n, latest_seq - min_seq)
+                    current = list(itertools.islice(_log_buf, n - count, n))
+                else:
+                    current = []
+            for c in clients:
+                if latest_seq > c.last_seq:
+                    frames = b"".join(e[2] for e in current if e[0] > c.last_seq)
+                    if c.backlog is not None:
+                        frames = bytes(c.backlog) + frames
+                    if len(frames) > _SSE_MAX_BACKLOG:
+                        self._drop(c)
+                        c.backlog = None
+                        continue
+                    c.backlog = memoryview(frames)
+                    c.last_seq = latest_seq
+
+            # select 한 번으로 끊긴 소켓 감지 + 쓸 수 있는 소켓만 골라 쓴다
+            socks = [c.sock for c in clients]
+            pending = [c for c in clients if c.backlog is not None]
+            try:
+                readable, writable, _ = select.select(
+                    socks, [c.sock for c in pending], [], 0
+                )
+            except Exception:
+                readable, writable = socks, [c.sock for c in pending]
+
+            dead = set()
+            for c in clients:
+                if c.sock in readable:
+                    try:
+                        if not c.sock.recv(4096):
+                            dead.add(c)
+                    except BlockingIOError:
+                        pass
+                    except Exception:
+                        dead.add(c)
+            for c in dead:
+                self._drop(c)
+
+            wset = set(writable)
+            for c in pending:
+                if c in dead or c.sock not in wset:
+                    continue
+                try:
+                    sent = c.sock.send(c.backlog)
+                    # 부분 전송이면 memoryview 슬라이스로 복사 없이 잔여분만 유지
+                    c.backlog = c.backlog[sent:] if sent < len(c.backlog) else None
+                except BlockingIOError:
+                    pass
+                except Exception:
+                    self._drop(c)
+
+
+_sse_broadcaster: Optional[_SSEBroadcaster] = None
+# 샘플러가 발행하는 (스냅샷 dict, 인코딩된 응답 바이트) 쌍
+_latest_metrics: Optional[Tuple[dict, bytes]] = None
+
+
+class _Sampler(threading.Thread):
+    """백그라운드에서 1초마다 메트릭을 갱신 - 요청 핸들러는 캐시만 읽는다"""
+
+    def __init__(self, interval_sec: float = 1.0) -> None:
+        super().__init__(daemon=True)
+        self.interval_sec = interval_sec
+        self._stop = threading.Event()
+
+    def run(self) -> None:
+        global _latest_metrics
+        while not self._stop.is_set():
+            try:
+                # JSON 인코딩도 틱당 한 번 - 요청은 캐시된 바이트를 그대로 쓴다
+                # (dict, body) 튜플 교체는 GIL 하에서 원자적이라 별도 락 불필요
+                metrics = _compute_metrics()
+                _latest_metrics = (metrics, _json_dumps(metrics))
+            except Exception:
+                pass
+            self._stop.wait(self.interval_sec)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def get_local_metrics() -> Tuple[dict, bytes]:
+    snap = _latest_metrics
+    if snap is not None:
+        return snap
+    # 샘플러가 아직 첫 스냅샷을 만들기 전이면 동기로 한 번 계산
+    metrics = _compute_metrics()
+    return metrics, _json_dumps(metrics)
+
+
 class AgentHandler(BaseHTTPRequestHandler):
     server_version = "S2WAgent/1.0"
+    # HTTP/1.1 로 keep-alive 유지 - _send_json 이 항상 Content-Length 를 보내므로 안전
+    protocol_version = "HTTP/1.1"
 
     def _send_json(self, obj: dict, status: int = 200) -> None:
+        self._send_json_bytes(_json_dumps(obj), status)
+
+    def _send_json_bytes(self, body: bytes, status: int = 200) -> None:
         try:
-            body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
             self.send_response(status)
             self.send_header("Content-Type", "application/json; charset=utf-8")
             self.send_header("Access-Control-Allow-Origin", "*")
@@ -326,9 +563,9 @@ class AgentHandler(BaseHTTPRequestHandler):
             self._send_json({"ok": True, "ts": int(time.time() * 1000)})
             return
         if parsed.path == DEFAULT_PATH:
-            metrics = get_local_metrics()
+            metrics, body = get_local_metrics()
             _maybe_log_metrics(metrics)
-            self._send_json(metrics)
+            self._send_json_bytes(body)
             return
         if parsed.path == "/logs":
             try:
@@ -341,35 +578,29 @@ class AgentHandler(BaseHTTPRequestHandler):
                 self.send_header("Access-Control-Allow-Headers", "*")
                 self.end_headers()
 
-                def send_line(line: str) -> bool:
+                def send_batch(payloads) -> bool:
+                    # 밀린 프레임들을 writelines 로 모아 쓰고 flush 는 배치당 한 번만
                     try:
-                        payload = f"data: {line}\n\n".encode("utf-8")
-                        self.wfile.write(payload)
+                        self.wfile.writelines(payloads)
                         self.wfile.flush()
                         return True
                     except Exception:
                         return False
 
-                with _log_cv:
-                    snapshot = list(_log_buf)[-60:]
-                    last_seq = snapshot[-1][0] if snapshot else 0
+                with _log_lock:
+                    n = len(_log_buf)
+                    snapshot = list(itertools.islice(_log_buf, max(0, n - 60), n))
+                last_seq = snapshot[-1][0] if snapshot else 0
 
-                if not send_line("[logs] connected"):
+                banner = _SSE_PREFIX + b"[logs] connected" + _SSE_SUFFIX
+                if not send_batch([banner] + [entry[2] for entry in snapshot]):
                     return
-                for _, line in snapshot:
-                    if not send_line(line):
-                        return
-
-                while True:
-                    with _log_cv:
-                        _log_cv.wait(timeout=10)
-                        current = list(_log_buf)
-                    for seq, line in current:
-                        if seq <= last_seq:
-                            continue
-                        last_seq = seq
-                        if not send_line(line):
-                            return
+
+                # 이후 스트리밍은 송신 스레드에 소켓을 넘기고 핸들러 스레드는 반환
+                if _sse_broadcaster is not None:
+                    self.close_connection = True
+                    sock = socket.socket(fileno=self.connection.detach())
+                    _sse_broadcaster.add_client(sock, last_seq)
             except Exception:
                 pass
             return
@@ -388,13 +619,19 @@ class AgentHandler(BaseHTTPRequestHandler):
 
 
 def run_agent_server(host: str, port: int) -> None:
+    global _sse_broadcaster
     httpd = ThreadingHTTPServer((host, port), AgentHandler)
+    sampler = _Sampler()
+    sampler.start()
+    _sse_broadcaster = _SSEBroadcaster()
+    _sse_broadcaster.start()
     _log(f"agent start http://{host}:{port}{DEFAULT_PATH} (logs: /logs)")
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         pass
     finally:
+        sampler.stop()
         httpd.server_close()
 
 
@@ -402,14 +639,19 @@ def latency_to_io_percent(latency_sec: float) -> float:
     return clamp(latency_sec * 100.0, 0.0, 100.0)
 
 
+# 폴링마다 TCP 연결을 새로 맺지 않도록 keep-alive 세션 재사용
+_http_session = requests.Session()
+
+
 def fetch_metrics(url: str) -> Tuple[Optional[dict], float]:
     start = time.time()
     try:
-        response = requests.get(url, timeout=5)
+        response = _http_session.get(url, timeout=5)
         latency = time.time() - start
         if response.status_code != 200:
             return None, latency
-        return response.json(), latency
+        # 인코딩 추측/str 변환 없이 응답 바이트를 바로 파싱
+        return _json_loads(response.content), latency
     except Exception:
         return None, time.time() - start
 
@@ -492,7 +734,9 @@ def run_aws_cli(cmdline: str) -> None:
         return
 
     try:
-        completed = subprocess.run(cmdline, shell=True, text=True, capture_output=True)
+        # 셸 fork 없이 argv 로 바로 실행 - 따옴표 처리는 shlex 가 담당
+        argv = shlex.split(cmdline)
+        completed = subprocess.run(argv, text=True, capture_output=True)
         if completed.stdout:
             print(completed.stdout.rstrip())
         if completed.stderr:
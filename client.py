@@ -3,6 +3,7 @@ from collections import deque
 import json
 import os
 import platform
+import shlex
 import shutil
 import subprocess
 import threading
@@ -18,6 +19,17 @@ try:
 except Exception:
     psutil = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 DEFAULT_REMOTE_IP = "3.36.74.135"
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 5000
@@ -299,6 +311,8 @@ def get_local_metrics() -> dict:
     }
 class AgentHandler(BaseHTTPRequestHandler):
     server_version = "S2WAgent/1.0"
+    # HTTP/1.1 로 keep-alive 유지 - _send_json 이 항상 Content-Length 를 보내므로 안전
+    protocol_version = "HTTP/1.1"
 
     def _send_json(self, obj: dict, status: int = 200) -> None:
         body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
@@ -392,13 +406,18 @@ def latency_to_io_percent(latency_sec: float) -> float:
     return clamp(latency_sec * 100.0, 0.0, 100.0)
 
 
+# 폴링마다 TCP 연결을 새로 맺지 않도록 keep-alive 세션 재사용
+_http_session = requests.Session()
+
+
 def fetch_metrics(url: str) -> Tuple[Optional[dict], float]:
     start = time.time()
-    response = requests.get(url, timeout=5)
+    response = _http_session.get(url, timeout=5)
     latency = time.time() - start
     if response.status_code != 200:
         return None, latency
-    return response.json(), latency
+    # 인코딩 추측/str 변환 없이 응답 바이트를 바로 파싱
+    return _json_loads(response.content), latency
 
 
 def print_metrics(data: dict, latency: float) -> None:
@@ -476,7 +495,9 @@ def run_aws_cli(cmdline: str) -> None:
         return
 
     try:
-        completed = subprocess.run(cmdline, shell=True, text=True, capture_output=True)
+        # 셸 fork 없이 argv 로 바로 실행 - 따옴표 처리는 shlex 가 담당
+        argv = shlex.split(cmdline)
+        completed = subprocess.run(argv, text=True, capture_output=True)
         if completed.stdout:
             print(completed.stdout.rstrip())
         if completed.stderr: